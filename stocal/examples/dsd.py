@@ -3,8 +3,10 @@
 The model is based on  rules that determine the behavior of DSD behaviour (Lakin, 2012)
 
 """
+import functools
 import math
 import re
+from collections import OrderedDict
 import stocal
 from stocal.structures import multiset
 
@@ -77,6 +79,23 @@ re_double_end_leak = re.compile(r'\[((\w[^<\[{]*?)\s(\w\^))\]')
 unbinding_rate =  0.1126  # Rate parameter for the unbinding rule
 covering_rate = 699  # Rate parameter for the covering rule
 leak_rate = 0.000003  # Rate parameter for the two leakage rules
+cache_size = 4096  # Maximum entries per cache. String helper caches are sized on import, rule caches check it on every call.
+
+
+@functools.lru_cache(maxsize=cache_size)
+def gates(sys):
+    """Return the match objects of all gates in a system. Rules scan the same systems for gates many times over,
+    so the scan is performed once per system and cached."""
+    return tuple(re_gate.finditer(sys))
+
+
+def toeholds(strand, regex):
+    """Index the toeholds matched by regex in a strand by their label. Binding looks up the toeholds of one strand
+    which match a toehold label of the other, rather than comparing every pair of toeholds."""
+    labelled = {}
+    for match in regex.finditer(strand):
+        labelled.setdefault(match.group(), []).append(match)
+    return labelled
 
 
 def check_in(seq):
@@ -94,11 +113,12 @@ def check_out(seq):
     return ""
 
 
+@functools.lru_cache(maxsize=cache_size)
 def tidy(sys):
     """Remove unnecessary whitespaces and empty brackets"""
-    sys = re.sub(re_large_spaces, " ", sys)  # Replaces spaces of length 2 or more with single spaces.
-    sys = re.sub(re_spaces, '', sys)  # Remove unnecessary spaces
-    sys = re.sub(re_empty, '', sys)  # Remove empty brackets
+    sys = re_large_spaces.sub(" ", sys)  # Replaces spaces of length 2 or more with single spaces.
+    sys = re_spaces.sub('', sys)  # Remove unnecessary spaces
+    sys = re_empty.sub('', sys)  # Remove empty brackets
     return sys
 
 
@@ -129,10 +149,10 @@ def fix_lower_gate(sys, match_obj, i):
 def merge_gates(sys):
     """This function identifies gates which only contain a single upper or lower strand, and merges this strand to an adjacent gate, with
     the following gate taking priority over the previous gate"""
-    upper_g_1 = re.search(re_lone_upper_1, sys)  # Matches on ^< >::{gate} or ::< >::{gate}
-    upper_g_2 = re.search(re_lone_upper_2, sys)  # Matches on {gate}::< >$
-    lower_g_1 = re.search(re_lone_lower_1, sys)  # Matches on ^{ }:{gate} or :{ }:{gate}
-    lower_g_2 = re.search(re_lone_lower_2, sys)  # Matches on {gate}:{ }$
+    upper_g_1 = re_lone_upper_1.search(sys)  # Matches on ^< >::{gate} or ::< >::{gate}
+    upper_g_2 = re_lone_upper_2.search(sys)  # Matches on {gate}::< >$
+    lower_g_1 = re_lone_lower_1.search(sys)  # Matches on ^{ }:{gate} or :{ }:{gate}
+    lower_g_2 = re_lone_lower_2.search(sys)  # Matches on {gate}:{ }$
 
     if upper_g_1 is not None:
         if upper_g_1.group(4) is not None:  # If 1st match condition of upper_g_1 is met.
@@ -163,10 +183,10 @@ def merge_gates(sys):
 def reformat(sys):
     """This function identifies non-standard patterns and re-formats it. For example, {A}<B>[C]<D>{E}::{F}<G>[H] must be rewritten
     as {A}<B>[C]{E}::{F}<D G>[H] to ensure that the reaction is reversible and the results are clear"""
-    format_1 = re.search(re_format_1, sys)
-    format_2 = re.search(re_format_2, sys)
-    format_3 = re.search(re_format_3, sys)
-    format_4 = re.search(re_format_4, sys)
+    format_1 = re_format_1.search(sys)
+    format_2 = re_format_2.search(sys)
+    format_3 = re_format_3.search(sys)
+    format_4 = re_format_4.search(sys)
 
     if format_1 is not None:
         upper = format_1.group(3)[1:len(format_1.group(3)) - 1] + " "
@@ -185,6 +205,7 @@ def reformat(sys):
         return sys
 
 
+@functools.lru_cache(maxsize=cache_size)
 def standardise(sys):
     """This function calls three other functions, which act to standardise a system. The format_seq function removes unnecessary spaces and empty
     brackets, the merge_lone_strands function appropriately merges gates which contain only a single strand, and the final function standardises
@@ -195,20 +216,17 @@ def standardise(sys):
     return sys
 
 
+@functools.lru_cache(maxsize=cache_size)
 def rotate(strand):
     """Takes a single upper or lower strand, and rotates it to be an upper or lower strand, respectively.
     Rotation is performed as defined in Lakin's DSD calculus"""
-    if re.search(re_gate, strand) is None:  # Check that the input is not a gate (this program does not rotate gates)
-        domains = check_in(strand).split(" ")[::-1]  # Remove brackets and reverse the domain sequence.
-        new_strand = ""  # Define empty strand.
-        if re.search(re_upper, strand) is not None:  # if upper strand, loop through reversed input and build lower strand.
-            for domain in domains:
-                new_strand = new_strand + " " + domain
-            return "{" + new_strand[1:] + "}"
-        elif re.search(re_lower, strand) is not None:  # if lower strand, loop through reversed input and build upper strand.
-            for domain in domains:
-                new_strand = new_strand + " " + domain
-            return "<" + new_strand[1:] + ">"
+    if not gates(strand):  # Check that the input is not a gate (this program does not rotate gates)
+        # Remove brackets and join the reversed domain sequence in a single pass.
+        new_strand = " ".join(check_in(strand).split(" ")[::-1])
+        if re_upper.search(strand) is not None:  # if upper strand, build lower strand from the reversed input.
+            return "{" + new_strand + "}"
+        elif re_lower.search(strand) is not None:  # if lower strand, build upper strand from the reversed input.
+            return "<" + new_strand + ">"
     else:
         return ""
 
@@ -225,6 +243,21 @@ def convert_lower_to_upper(strand):
     return re.sub(r'\*', "", strand)
 
 
+@functools.lru_cache(maxsize=cache_size)
+def upper_leak_pattern(domains):
+    """Compile the pattern on which an upper invader strand matches the given double strand domains in a leak.
+    Patterns are cached, since the same double strands are tested against many invaders."""
+    re_domains = re.sub(r'\^', "\\^", domains)
+    return re.compile(re_domains + "$|" + re_domains + " ")
+
+
+@functools.lru_cache(maxsize=cache_size)
+def lower_leak_pattern(domains):
+    """Compile the pattern on which a lower invader strand matches the given double strand domains in a leak"""
+    re_domains = re.sub(r'\^', "\\^", domains)
+    return re.compile(re.sub(r'(?<=\S)\s', r"\* ", re_domains) + r"\*")
+
+
 def get_binding_rate(t_h_label):
     """Calculate the binding rate for a given toehold. Calculates it based on nucleotide length.
     # If nucleotide length is unknown, then the toehold length of 7 is used, which is an average toehold length."""
@@ -249,15 +282,47 @@ def get_migration_rate(domain_label):
     return 8000/(nuc_length**2)
 
 
+def memoize_reactions(novel_reactions):
+    """Cache the reactions a rule infers, keyed by the rule, its reactants, the domains table and the rate parameters.
+    Least recently used entries are evicted beyond the current cache_size, and the cache can be emptied via
+    novel_reactions.cache.clear()."""
+    cache = OrderedDict()
+
+    @functools.wraps(novel_reactions)
+    def wrapper(self, *reactants):
+        key = (type(self), frozenset(domains.items()), (unbinding_rate, covering_rate, leak_rate),
+               tuple(sorted(reactants)) if getattr(self, 'symmetric', False) else reactants)
+        if key in cache:
+            cache.move_to_end(key)
+            for trans_reactants, products, constant in cache[key]:
+                yield self.Transition(trans_reactants, products, constant)
+            return
+        # Yield reactions as they are inferred, and only cache them once the rule is exhausted,
+        # so that callers which stop after the first reaction do not pay for the rest.
+        specs = []
+        for trans in novel_reactions(self, *reactants):
+            spec = (trans.reactants, dict(trans.products), trans.constant)
+            specs.append(spec)
+            yield self.Transition(*spec)
+        cache[key] = tuple(specs)
+        while len(cache) > cache_size:
+            cache.popitem(last=False)
+    wrapper.cache = cache
+    return wrapper
+
+
 class BindingRule(stocal.TransitionRule):
     """Join any two strings into their concatenations"""
     Transition = stocal.MassAction
 
+    @memoize_reactions
     def novel_reactions(self, k, l):
-        gate_k = re.search(re_gate, k)
-        gate_l = re.search(re_gate, l)
+        if "^" not in k or "^" not in l:  # Binding requires a toehold on both reactants.
+            return
+        gate_k = gates(k)
+        gate_l = gates(l)
         # Call the appropriate function depending if k and l are both strands, or a gate and a strand.
-        if (gate_k is None and gate_l is not None) or (gate_l is None and gate_k is not None):
+        if (not gate_k and gate_l) or (not gate_l and gate_k):
             yield from self.strand_to_gate_binding(k, l, re_upper_lab, re_lower_lab)
             yield from self.strand_to_gate_binding(l, k, re_upper_lab, re_lower_lab)
             yield from self.strand_to_gate_binding(k, rotate(l), re_upper_lab, re_lower_lab)
@@ -266,7 +331,7 @@ class BindingRule(stocal.TransitionRule):
             yield from self.strand_to_gate_binding(l, k, re_lower_lab, re_upper_lab)
             yield from self.strand_to_gate_binding(k, rotate(l), re_lower_lab, re_upper_lab)
             yield from self.strand_to_gate_binding(l, rotate(k), re_lower_lab, re_upper_lab)
-        elif gate_k is None or gate_l is None:
+        elif not gate_k or not gate_l:
             yield from self.strand_to_strand_binding(k, l, re_upper_lab, re_lower_lab)
             yield from self.strand_to_strand_binding(k, l, re_lower_lab, re_upper_lab)
             yield from self.strand_to_strand_binding(rotate(k), l, re_upper_lab, re_lower_lab)
@@ -274,75 +339,78 @@ class BindingRule(stocal.TransitionRule):
 
     def strand_to_gate_binding(self, k, l, regex_1, regex_2):
         """Simulates binding between a gate and a single upper or lower strand"""
-        for gate in re.finditer(re_gate, k):   # Loop through the gates in system k.
+        l_toeholds = toeholds(l, regex_2)  # Index the toeholds of l by label, so matching is a lookup.
+        for gate in gates(k):   # Loop through the gates in system k.
             # The next two for loops attempt to find matching upper and lower toeholds on the gate and strand.
-            for match in re.finditer(regex_1, gate.group()):
-                for match_2 in re.finditer(regex_2, l):
-                    if match.group() == match_2.group(): # If matching toeholds are found
-                        binding_rate = get_binding_rate(match.group())
-                        d_s = "[" + match.group() + "^]"
-                        i = gate.start()
-                        if regex_1 == re_upper_lab:
-                            l_s_1 = "{" + l[1:match_2.start()] + "}"
-                            l_s_2 = "{" + l[match_2.end() + 2:len(l) - 1] + "}"
-                            if match.start() > gate.start(2) - i and match.end() < gate.end(2) - i:
-                                u_s_1 = "<" + k[gate.start(2) + 1:match.start() + i] + ">"
-                                u_s_2 = "<" + k[match.end() + 1 + i:gate.end(2) - 1] + ">"
-                                sys = k[:gate.start()] + l_s_1 + u_s_1 + d_s + l_s_2 + "::" + gate.group(1) + u_s_2 + k[gate.start(3):]
-                                yield self.Transition([k, l], [standardise(sys)], binding_rate)
-                            elif match.start() > gate.start(4) - i and match.end() < gate.end(4) - i:
-                                u_s_1 = "<" + k[gate.start(4) + 1:match.start() + i] + ">"
-                                u_s_2 = "<" + k[match.end() + i + 1:gate.end(4) - 1] + ">"
-                                sys = k[:gate.end(3)] + check_out(gate.group(5)) + "::" + l_s_1 + u_s_1 + d_s + u_s_2 + l_s_2 + k[gate.end():]
-                                yield self.Transition([k, l], [standardise(sys)], binding_rate)
-                        else:
-                            u_s_1 = "<" + l[1:match_2.start()] + ">"
-                            u_s_2 = "<" + l[match_2.end() + 2:len(l) - 1] + ">"
-                            if match.start() > gate.start(1) - i and match.end() < gate.end(1) - i:
-                                l_s_1 = "{" + k[gate.start(1) + 1:match.start() + i] + "}"
-                                l_s_2 = "{" + k[match.end() + i + 2:gate.end(1) - 1] + "}"
-                                sys = k[:gate.start()] + l_s_1 + u_s_1 + d_s + u_s_2 + l_s_2 + ":" + check_out(gate.group(2)) + k[gate.start(3):]
-                                yield self.Transition([k, l], [standardise(sys)], binding_rate)
-                            elif match.start() > gate.start(5) - i and match.end() < gate.end(5) - i:
-                                l_s_1 = "{" + k[gate.start(5) + 1:match.start() + i] + "}"
-                                l_s_2 = "{" + k[match.end() + i + 2:gate.end(5) - 1] + "}"
-                                sys = k[:gate.end(3)] + check_out(gate.group(4)) + ":" + l_s_1 + u_s_1 + d_s + u_s_2 + l_s_2 + k[gate.end():]
-                                yield self.Transition([k, l], [standardise(sys)], binding_rate)
+            for match in regex_1.finditer(gate.group()):
+                for match_2 in l_toeholds.get(match.group(), ()):
+                    binding_rate = get_binding_rate(match.group())
+                    d_s = "[" + match.group() + "^]"
+                    i = gate.start()
+                    if regex_1 == re_upper_lab:
+                        l_s_1 = "{" + l[1:match_2.start()] + "}"
+                        l_s_2 = "{" + l[match_2.end() + 2:len(l) - 1] + "}"
+                        if match.start() > gate.start(2) - i and match.end() < gate.end(2) - i:
+                            u_s_1 = "<" + k[gate.start(2) + 1:match.start() + i] + ">"
+                            u_s_2 = "<" + k[match.end() + 1 + i:gate.end(2) - 1] + ">"
+                            sys = k[:gate.start()] + l_s_1 + u_s_1 + d_s + l_s_2 + "::" + gate.group(1) + u_s_2 + k[gate.start(3):]
+                            yield self.Transition([k, l], [standardise(sys)], binding_rate)
+                        elif match.start() > gate.start(4) - i and match.end() < gate.end(4) - i:
+                            u_s_1 = "<" + k[gate.start(4) + 1:match.start() + i] + ">"
+                            u_s_2 = "<" + k[match.end() + i + 1:gate.end(4) - 1] + ">"
+                            sys = k[:gate.end(3)] + check_out(gate.group(5)) + "::" + l_s_1 + u_s_1 + d_s + u_s_2 + l_s_2 + k[gate.end():]
+                            yield self.Transition([k, l], [standardise(sys)], binding_rate)
+                    else:
+                        u_s_1 = "<" + l[1:match_2.start()] + ">"
+                        u_s_2 = "<" + l[match_2.end() + 2:len(l) - 1] + ">"
+                        if match.start() > gate.start(1) - i and match.end() < gate.end(1) - i:
+                            l_s_1 = "{" + k[gate.start(1) + 1:match.start() + i] + "}"
+                            l_s_2 = "{" + k[match.end() + i + 2:gate.end(1) - 1] + "}"
+                            sys = k[:gate.start()] + l_s_1 + u_s_1 + d_s + u_s_2 + l_s_2 + ":" + check_out(gate.group(2)) + k[gate.start(3):]
+                            yield self.Transition([k, l], [standardise(sys)], binding_rate)
+                        elif match.start() > gate.start(5) - i and match.end() < gate.end(5) - i:
+                            l_s_1 = "{" + k[gate.start(5) + 1:match.start() + i] + "}"
+                            l_s_2 = "{" + k[match.end() + i + 2:gate.end(5) - 1] + "}"
+                            sys = k[:gate.end(3)] + check_out(gate.group(4)) + ":" + l_s_1 + u_s_1 + d_s + u_s_2 + l_s_2 + k[gate.end():]
+                            yield self.Transition([k, l], [standardise(sys)], binding_rate)
 
     def strand_to_strand_binding(self, k, l, regex_1, regex_2):
         """Simulates an upper and lower strand annealing together"""
         # The next two loops are to loop through matching toeholds found on the two strands.
-        for match_1 in re.finditer(regex_1, k):
-            for match_2 in re.finditer(regex_2, l):
-                if match_1.group() == match_2.group():
-                    binding_rate = get_binding_rate(match_1.group())
-                    d_s = "[" + match_2.group() + "^]"
-                    part_a = l[:match_2.start()] + re.search(re_close, l[match_2.start():]).group()
-                    part_b = k[:match_1.start()] + re.search(re_close, k[match_1.start():]).group()
-                    part_c = re.search(re_open, k[:match_1.end() + 1]).group()
-                    part_d = re.search(re_open, l[:match_2.end()]).group()
-                    if regex_1 == re_upper_lab:
-                        sys = part_a + part_b + d_s + part_c + k[match_1.end() + 1:] + part_d + l[match_2.end() + 2:]
-                    else:
-                        sys = part_b + part_a + d_s + part_d + l[match_2.end() + 1:] + part_c + k[match_1.end() + 2:]
-                    yield self.Transition([k, l], [tidy(sys)], binding_rate)
+        l_toeholds = toeholds(l, regex_2)
+        for match_1 in regex_1.finditer(k):
+            for match_2 in l_toeholds.get(match_1.group(), ()):
+                binding_rate = get_binding_rate(match_1.group())
+                d_s = "[" + match_2.group() + "^]"
+                part_a = l[:match_2.start()] + re_close.search(l[match_2.start():]).group()
+                part_b = k[:match_1.start()] + re_close.search(k[match_1.start():]).group()
+                part_c = re_open.search(k[:match_1.end() + 1]).group()
+                part_d = re_open.search(l[:match_2.end()]).group()
+                if regex_1 == re_upper_lab:
+                    sys = part_a + part_b + d_s + part_c + k[match_1.end() + 1:] + part_d + l[match_2.end() + 2:]
+                else:
+                    sys = part_b + part_a + d_s + part_d + l[match_2.end() + 1:] + part_c + k[match_1.end() + 2:]
+                yield self.Transition([k, l], [tidy(sys)], binding_rate)
 
 
 class UnbindingRule(stocal.TransitionRule):
     """Splits a system into two systems when a toehold unbinds"""
     Transition = stocal.MassAction
 
+    @memoize_reactions
     def novel_reactions(self, kl):
+        if "[" not in kl or "^" not in kl:  # Unbinding requires a double toehold.
+            return
         yield from self.toehold_unbinding(kl)
 
     def toehold_unbinding(self, kl):
         """This function loops through a system gate by gate, and identifies double strands which can be unbound i.e.
         double strands of the form [A^]. It then yields the two separate parts, which would be produced when that double strand
         (toehold) unbound."""
-        for gate in re.finditer(re_gate, kl):  # Loop through the system gate by gate.
-            d_s = re.search(re_short_double_th, gate.group())  # If one exists, retrieve the unbindable double strand in the gate.
+        for gate in gates(kl):  # Loop through the system gate by gate.
+            d_s = re_short_double_th.search(gate.group())  # If one exists, retrieve the unbindable double strand in the gate.
             if d_s is not None:
-                label = re.search(re_double_lab, d_s.group()).group()  # Retrieve label of unbindable toehold.
+                label = re_double_lab.search(d_s.group()).group()  # Retrieve label of unbindable toehold.
                 part_a = "<" + check_in(gate.group(2)) + " " + label + "^ " + check_in(gate.group(4)) + ">"  # Build upper part of gate.
                 part_b = "{" + check_in(gate.group(1)) + " " + label + "^* " + check_in(gate.group(5)) + "}"  # Build lower part pf hate
                 # Assemble the gates with the rest of the system, depending on how the gates were connected.
@@ -364,11 +432,14 @@ class CoveringRule(stocal.TransitionRule):
      exposed toehold in the upper strand"""
     Transition = stocal.MassAction
 
+    @memoize_reactions
     def novel_reactions(self, k):
+        if "^*" not in k:  # Covering requires an unbound lower toehold.
+            return
         yield from self.toehold_covering(k)
 
     def toehold_covering(self, k):
-        for match in re.finditer(re_post_cover, k):  # Match on <>{} or <>:{} or {}::{}?<> sequences where Covering can be applied.
+        for match in re_post_cover.finditer(k):  # Match on <>{} or <>:{} or {}::{}?<> sequences where Covering can be applied.
             if match.group(1) is not None:  # If matching on <>{} or <>:{} then apply covering to system.
                 updated_sys = k[:match.start()-1] + " " + match.group(1) + "^]<" + check_out(match.group(2)) + ">" + \
                     check_out(match.group(3)) + "{" + check_out(match.group(5)) + "}" + k[match.end():]
@@ -376,7 +447,7 @@ class CoveringRule(stocal.TransitionRule):
                 updated_sys = k[:match.start()-2] + " " + match.group(6) + "^]{" + check_out(match.group(7)) + "}::" + \
                     check_out(match.group(8)) + "<" + check_out(match.group(10)) + ">" + k[match.end():]
             yield self.Transition([k], [tidy(updated_sys)], covering_rate)
-        for match in re.finditer(re_pre_cover, k):  # Match on {}<> sequences where Covering can be applied.
+        for match in re_pre_cover.finditer(k):  # Match on {}<> sequences where Covering can be applied.
             updated_sys = k[:match.start()] + "{" + check_out(match.group(1)) + "}<" + check_out(match.group(3)) + ">[" + \
                 match.group(2) + "^ " + k[match.end()+1:]
             yield self.Transition([k], [tidy(updated_sys)], covering_rate)
@@ -386,7 +457,10 @@ class MigrationRule(stocal.TransitionRule):
     """Migrates an upper or lower overhang up/down a strand via branch migration"""
     Transition = stocal.MassAction
 
+    @memoize_reactions
     def novel_reactions(self, k):
+        if ":" not in k:  # Migration only occurs between gates joined by a strand.
+            return
         k = tidy(k)
         yield from self.migrate(k, re_lower_migrate, re_lower)
         yield from self.migrate(k, re_upper_migrate, re_upper)
@@ -394,7 +468,7 @@ class MigrationRule(stocal.TransitionRule):
         yield from self.migrate_rev(k, re_upper_migrate_r, re_upper)
 
     def migrate(self, k, regex_1, regex_2):
-        for match in re.finditer(regex_1, k):
+        for match in regex_1.finditer(k):
             migration_rate = get_migration_rate(match.group(3))
             i = match.start()
             d_s_1 = match.group(1)[:len(match.group(1))-1] + " " + match.group(3) + "]"
@@ -411,7 +485,7 @@ class MigrationRule(stocal.TransitionRule):
             yield self.Transition([k], [seq], migration_rate)
 
     def migrate_rev(self, k, regex_1, regex_2):
-        for match in re.finditer(regex_1, k):
+        for match in regex_1.finditer(k):
             migration_rate = get_migration_rate(match.group(2))
             i = match.start()
             d_s_1 = match.group()[:match.start(2)-i] + "]"
@@ -432,7 +506,10 @@ class DisplacementRule(stocal.TransitionRule):
     """Splits two strings when one strand displaces another"""
     Transition = stocal.MassAction
 
+    @memoize_reactions
     def novel_reactions(self, k):
+        if ":" not in k:  # Displacement only occurs between gates joined by a strand.
+            return
         k = tidy(k)
         yield from self.displacement_fwd(k, re_displace_upper)
         yield from self.displacement_fwd(k, re_displace_lower)
@@ -440,7 +517,7 @@ class DisplacementRule(stocal.TransitionRule):
         yield from self.displacement_rev(k, re_displace_lower_r)
 
     def displacement_fwd(self, k, regex_1):
-        for match in re.finditer(regex_1, k):
+        for match in regex_1.finditer(k):
             displacement_rate = get_migration_rate(match.group(2))
             strand_1 = check_in(match.group(4)) + " " + match.group(2) + " "
             start = k[:match.end(1)-1] + " " + match.group(2) + "]"
@@ -461,7 +538,7 @@ class DisplacementRule(stocal.TransitionRule):
             yield self.Transition([k], [strand_1, strand_2], displacement_rate)
 
     def displacement_rev(self, k, regex_1):
-        for match in re.finditer(regex_1, k):
+        for match in regex_1.finditer(k):
             displacement_rate = get_migration_rate(match.group(3))
             if regex_1 == re_displace_upper_r:
                 if k[match.start()-2:match.start()] != "::":
@@ -484,41 +561,39 @@ class DisplacementRule(stocal.TransitionRule):
 class StrandLeakageRule(stocal.TransitionRule):
     """Simulate leak reactions on a double-stranded complex"""
     Transition = stocal.MassAction
+    symmetric = True
 
+    @memoize_reactions
     def novel_reactions(self, k, l):
-        gate_k = re.search(re_gate, k)
-        gate_l = re.search(re_gate, l)
-        if (gate_k is None and gate_l is not None) or (gate_l is None and gate_k is not None):
+        gate_k = gates(k)
+        gate_l = gates(l)
+        if (not gate_k and gate_l) or (not gate_l and gate_k):
             yield from self.strand_leak(k, l)
             yield from self.strand_leak(l, k)
 
     def upper_strand_leakage(self, k, l, mod_l, gate):
         leaked_u_s = "<" + check_in(gate.group(2)) + " " + check_in(gate.group(3)) + " " + check_in(gate.group(4)) + ">"
-        re_strand = re.sub(r'\^', "\\^", check_in(gate.group(3)))
-        re_strand_2 = re_strand + "$|" + re_strand + " "
-        for match in re.finditer(fr'{re_strand_2}', mod_l):  # Yield suitable (upper) leaks.
+        for match in upper_leak_pattern(check_in(gate.group(3))).finditer(mod_l):  # Yield suitable (upper) leaks.
             new_sys = k[:gate.start()] + check_out(gate.group(1)) + "<" + mod_l[:match.start()] + ">" + gate.group(3) + "<" + \
                       mod_l[match.end():] + ">" + check_out(gate.group(5)) + k[gate.end():]
             yield self.Transition([k, l], [tidy(new_sys), tidy(leaked_u_s)], leak_rate)
 
     def lower_strand_leakage(self, k, l, mod_l, gate):
-        re_strand = re.sub(r'\^', "\\^", check_in(gate.group(3)))
-        re_strand = re.sub(r'(?<=\S)\s', "\* ", re_strand) + "\*"
         leaked_l_s = "{" + check_in(gate.group(1)) + " " + convert_upper_to_lower(check_in(gate.group(3))) + \
                      " " + check_in(gate.group(5)) + "}"
-        for match in re.finditer(fr'{re_strand}', mod_l): # Yield suitable (lower) leaks.
+        for match in lower_leak_pattern(check_in(gate.group(3))).finditer(mod_l): # Yield suitable (lower) leaks.
             new_sys = k[:gate.start()] + "{" + mod_l[:match.start()] + "}" + k[gate.start(2):gate.end(4)] +\
               "{" + mod_l[match.end():] + "}" + k[gate.end():]
             yield self.Transition([k, l], [tidy(new_sys), tidy(leaked_l_s)], leak_rate)
 
     def strand_leak(self, k, l):
-        for gate in re.finditer(re_gate, k):
-            if re.search(re_short_double_th, gate.group(3)) is None:  # Checks that the d_s in the gate is not of the form [A^]
+        for gate in gates(k):
+            if re_short_double_th.search(gate.group(3)) is None:  # Checks that the d_s in the gate is not of the form [A^]
                 upper_gate_join_1 = k[gate.start()-2:gate.start()]  # Used to check if current gate joins last gate via an upper strand.
                 upper_gate_join_2 = k[gate.end():gate.end()+2]  # Used to check if current gate joins next gate via an upper strand.
                 lower_gate_join_1 = k[gate.start() - 2:gate.start() - 1]  # Used to check if current gate joins last gate via a lower strand.
                 lower_gate_join_2 = k[gate.end() + 1:gate.end() + 2]  # Used to check if current gate joins next gate via a lower strand.
-                if re.search(re_upper, l) is not None:  # If the strand initiating the leak is an upper strand:
+                if re_upper.search(l) is not None:  # If the strand initiating the leak is an upper strand:
                     if upper_gate_join_1 != "::" and upper_gate_join_2 != "::":  # Check gate isn't joined to others by upper strand.
                         yield from self.upper_strand_leakage(k, l, check_in(l), gate)
                     if lower_gate_join_1 != ":" and lower_gate_join_2 != ":":  # Check gate isn't joined to others by lower strand.
@@ -533,19 +608,19 @@ class StrandLeakageRule(stocal.TransitionRule):
 class ToeholdLeakageRule(stocal.TransitionRule):
     """Simulates a leak on a strand where a toehold has to spontaneously unbind for the leak to occur"""
     Transition = stocal.MassAction
+    symmetric = True
 
+    @memoize_reactions
     def novel_reactions(self, k, l):
-        gate_k = re.search(re_gate, k)
-        gate_l = re.search(re_gate, l)
-        if (gate_k is None and gate_l is not None) or (gate_l is None and gate_k is not None):
+        gate_k = gates(k)
+        gate_l = gates(l)
+        if (not gate_k and gate_l) or (not gate_l and gate_k):
             yield from self.toehold_leak(k, l)
             yield from self.toehold_leak(l, k)
 
     def lower_toehold_leakage_at_end(self, k, l, end_leak, mod_l, gate):
         re_check_not_l_s = "^" + re.sub(r'\^', "\\^", end_leak.group(3))
-        re_end_leak = convert_upper_to_lower(re.sub(r'\^', "\\^", end_leak.group(2)))
-        re_leak = re.sub(r'\*', "\\*", re_end_leak)
-        for match in re.finditer(re_leak, mod_l):
+        for match in lower_leak_pattern(end_leak.group(2)).finditer(mod_l):
             if re.search(re_check_not_l_s, l[match.end():]) is None:
                 leaked_l_s = "{" + check_in(gate.group(1)) + " " + convert_upper_to_lower(end_leak.group(1)) +\
                                  " " + check_in(gate.group(5)) + "}"
@@ -555,9 +630,7 @@ class ToeholdLeakageRule(stocal.TransitionRule):
 
     def upper_toehold_leakage_at_end(self, k, l, end_leak, mod_l, gate):
         re_check_not_l_s = "^" + re.sub(r'\^', "\\^", end_leak.group(3))
-        re_end_leak = re.sub(r'\^', "\\^", end_leak.group(2))
-        re_end_leak_2 = re_end_leak + "$|" + re_end_leak + " "
-        for match in re.finditer(re_end_leak_2, mod_l):
+        for match in upper_leak_pattern(end_leak.group(2)).finditer(mod_l):
             if re.search(re_check_not_l_s, l[match.end():]) is None:
                 leaked_u_s = "<" + check_in(gate.group(2)) + " " + end_leak.group(1) + " " + check_in(gate.group(4)) + ">"
                 new_sys = k[:gate.start(2)] + "<" + mod_l[:match.start()] + ">[" + end_leak.group(2) + "]<" + \
@@ -566,9 +639,7 @@ class ToeholdLeakageRule(stocal.TransitionRule):
 
     def lower_toehold_leakage_at_start(self, k, l, start_leak, mod_l, gate):
         re_check_not_l_s = re.sub(r'\^', "\\^", start_leak.group(2)) + "$"
-        re_start_leak = convert_upper_to_lower(re.sub(r'\^', "\\^", start_leak.group(3)))
-        re_leak = re.sub(r'\*', "\\*", re_start_leak)
-        for match in re.finditer(re_leak, mod_l):
+        for match in lower_leak_pattern(start_leak.group(3)).finditer(mod_l):
             if re.search(re_check_not_l_s, l[match.end():]) is None:
                 leaked_l_s = "{" + check_in(gate.group(1)) + " " + convert_upper_to_lower(start_leak.group(1)) +\
                                  " " + check_in(gate.group(5)) + "}"
@@ -579,9 +650,7 @@ class ToeholdLeakageRule(stocal.TransitionRule):
 
     def upper_toehold_leakage_at_start(self, k, l, start_leak, mod_l, gate):
         re_check_not_l_s = re.sub(r'\^', "\\^", start_leak.group(2)) + "$"
-        re_start_leak = re.sub(r'\^', "\\^", start_leak.group(3))
-        re_start_leak_2 = re_start_leak + "$|" + re_start_leak + " "
-        for match in re.finditer(re_start_leak_2, mod_l):
+        for match in upper_leak_pattern(start_leak.group(3)).finditer(mod_l):
             if re.search(re_check_not_l_s, mod_l[:match.start()]) is None:  # TODO: Check this check works
                 leaked_u_s = "<" + check_in(gate.group(2)) + " " + start_leak.group(1) + " " + check_in(gate.group(4)) + ">"
                 new_sys = k[:gate.start()] + "{" + check_in(gate.group(1)) + " " + start_leak.group(2) + "*}<" +\
@@ -589,14 +658,14 @@ class ToeholdLeakageRule(stocal.TransitionRule):
                 yield self.Transition([k, l], [tidy(leaked_u_s), tidy(new_sys)], leak_rate)
 
     def toehold_leak(self, k, l):
-        for gate in re.finditer(re_gate, k):
-            start_leak = re.search(re_double_start_leak, gate.group())
-            end_leak = re.search(re_double_end_leak, gate.group())
+        for gate in gates(k):
+            start_leak = re_double_start_leak.search(gate.group())
+            end_leak = re_double_end_leak.search(gate.group())
             upper_gate_join_1 = k[gate.start()-2:gate.start()]  # Used to check if current gate joins last gate via an upper strand.
             upper_gate_join_2 = k[gate.end():gate.end()+2]  # Used to check if current gate joins next gate via an upper strand.
             lower_gate_join_1 = k[gate.start() - 2:gate.start() - 1]  # Used to check if current gate joins last gate via a lower strand.
             lower_gate_join_2 = k[gate.end() + 1:gate.end() + 2]  # Used to check if current gate joins next gate via a lower strand.
-            if re.search(re_upper, l) is not None:
+            if re_upper.search(l) is not None:
                 if upper_gate_join_1 != "::" and upper_gate_join_2 != "::":   # Check gate isn't joined to others by upper strand.
                     if start_leak is not None:
                         yield from self.upper_toehold_leakage_at_start(k, l, start_leak, check_in(l), gate)